@@ -0,0 +1,31 @@
+"""Regenerate the pre-rendered Pygments stylesheets shipped with slidr.
+
+Pygments produces identical CSS for a given style on every run, so the
+styles we ship are rendered once here and loaded as package data at
+runtime (see ``_build_pygments_css`` in ``slidr.build``). Re-run this
+script after bumping the Pygments dependency or adding a style:
+
+    python scripts/generate_pygments_css.py
+"""
+
+from pathlib import Path
+
+from pygments.formatters import HtmlFormatter  # type: ignore
+
+# Styles rendered ahead of time; "monokai" is slidr's default.
+STYLES = ("monokai",)
+
+OUTPUT_DIR = Path(__file__).parent.parent / "src" / "slidr" / "assets" / "pygments"
+
+
+def main() -> None:
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    for style in STYLES:
+        css = HtmlFormatter(style=style).get_style_defs("pre code")
+        output_file = OUTPUT_DIR / f"{style}.css"
+        output_file.write_text(css + "\n", encoding="utf-8")
+        print(f"Wrote {output_file}")
+
+
+if __name__ == "__main__":
+    main()
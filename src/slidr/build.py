@@ -1,29 +1,128 @@
 """Build HTML from markdown deck."""
 
+from __future__ import annotations
+
 import argparse
+import os
 import re
 import time
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import yaml
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from markdown_it import MarkdownIt
-from mdit_py_plugins.dollarmath import dollarmath_plugin
-from mdit_py_plugins.front_matter import front_matter_plugin
-from pygments import highlight as pygments_highlight
-from pygments.formatters import HtmlFormatter  # type: ignore
-from pygments.lexers import TextLexer, get_lexer_by_name  # type: ignore
-from pygments.util import ClassNotFound
+# Heavyweight dependencies (yaml, jinja2, markdown-it, pygments) are
+# imported lazily inside the functions that need them, so CLI commands
+# that never build a deck don't pay their import cost.
+if TYPE_CHECKING:
+    from markdown_it import MarkdownIt
+    from pygments.formatters import HtmlFormatter  # type: ignore
+    from pygments.lexer import Lexer
 
 from .logging_utils import get_logger
-from .utils import get_default_theme_path, get_templates_dir, resolve_theme_path
+from .utils import (
+    get_assets_dir,
+    get_default_theme_path,
+    get_templates_dir,
+    resolve_theme_path,
+)
 
-logger = get_logger(__name__)
+LOGGER_NAME = __name__
+logger = get_logger(LOGGER_NAME)
 
 
 COMMON_NON_DECK_FILES = {"readme.md", "agents.md", "contributing.md", "changelog.md"}
 
+# Pattern to match front matter at the start of the file (CRLF tolerant)
+_FRONT_MATTER_RE = re.compile(r"\A---[ \t]*\r?\n(.*?)\r?\n---[ \t]*\r?\n", re.DOTALL)
+
+# Front-matter values that disable code highlighting
+_OFF_VALUES = frozenset({"off", "false", "no", "none", "0"})
+
+# Accepted values for the front-matter "align" option
+_VALID_ALIGNMENTS = frozenset({"left", "center", "right", "justify"})
+
+
+@lru_cache(maxsize=1)
+def _get_text_lexer() -> Lexer:
+    """Build the shared plain-text fallback lexer."""
+    from pygments.lexers import TextLexer  # type: ignore
+
+    return TextLexer()
+
+
+@lru_cache(maxsize=128)
+def _get_lexer(lang: str) -> Lexer | None:
+    """Look up a Pygments lexer by name, caching the result.
+
+    ``get_lexer_by_name`` walks the plugin registry on every call, which
+    dominates highlighting cost for decks with many code blocks.
+
+    Args:
+        lang: Language name from the fenced code block.
+
+    Returns:
+        The lexer instance, or None when the language is unknown.
+    """
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+
+    try:
+        return get_lexer_by_name(lang)
+    except ClassNotFound:
+        logger.debug("Unknown code language '%s'. Falling back to text lexer.", lang)
+        return None
+
+
+@lru_cache(maxsize=1)
+def _get_yaml_loader():
+    """Return the fastest available safe YAML loader.
+
+    The LibYAML bindings parse front matter in C when available.
+    """
+    try:
+        from yaml import CSafeLoader
+
+        return CSafeLoader
+    except ImportError:  # pragma: no cover
+        from yaml import SafeLoader
+
+        return SafeLoader
+
+
+def _match_front_matter(markdown_content: str) -> tuple[dict | None, int]:
+    """Parse YAML front matter and return it with the body offset.
+
+    Avoids copying the document body: callers that also split slides can
+    pass the offset along instead of slicing off the remainder.
+
+    Args:
+        markdown_content: Raw markdown content
+
+    Returns:
+        Tuple of (front_matter_dict, body_offset). The offset is 0 when
+        no valid front matter is present.
+    """
+    match = _FRONT_MATTER_RE.match(markdown_content)
+
+    if not match:
+        return None, 0
+
+    import yaml
+
+    try:
+        front_matter = yaml.load(match.group(1), Loader=_get_yaml_loader())
+    except yaml.YAMLError as e:
+        logger.warning(f"Failed to parse front matter YAML: {e}")
+        return None, 0
+
+    if not isinstance(front_matter, dict):
+        # A scalar or list between the markers is not front matter;
+        # leave the block in the document body.
+        return None, 0
+
+    return front_matter, match.end()
+
 
 def extract_front_matter(markdown_content: str) -> tuple[dict | None, str]:
     """Extract YAML front matter from markdown content.
@@ -41,22 +140,8 @@ def extract_front_matter(markdown_content: str) -> tuple[dict | None, str]:
         - front_matter_dict: Parsed YAML as dict, or None if no front matter
         - remaining_content: Markdown content without front matter
     """
-    # Pattern to match front matter at the start of the file
-    pattern = r"^---\s*\n(.*?)\n---\s*\n"
-    match = re.match(pattern, markdown_content, re.DOTALL)
-
-    if match:
-        yaml_content = match.group(1)
-        try:
-            front_matter = yaml.safe_load(yaml_content)
-            # Remove front matter from content
-            remaining_content = markdown_content[match.end() :]
-            return front_matter, remaining_content
-        except yaml.YAMLError as e:
-            logger.warning(f"Failed to parse front matter YAML: {e}")
-            return None, markdown_content
-
-    return None, markdown_content
+    front_matter, body_start = _match_front_matter(markdown_content)
+    return front_matter, markdown_content[body_start:]
 
 
 def _resolve_code_highlight_style(front_matter: dict | None) -> str | None:
@@ -68,7 +153,7 @@ def _resolve_code_highlight_style(front_matter: dict | None) -> str | None:
     Returns:
         Pygments style name or None to disable highlighting.
     """
-    if not isinstance(front_matter, dict):
+    if not front_matter:
         return None
 
     raw_value = front_matter.get("code_highlight")
@@ -76,17 +161,19 @@ def _resolve_code_highlight_style(front_matter: dict | None) -> str | None:
         return None
 
     normalized = raw_value.strip()
-    if not normalized:
-        return None
-
-    if normalized.lower() in {"off", "false", "no", "none"}:
+    if not normalized or normalized.lower() in _OFF_VALUES:
         return None
 
     return normalized
 
 
+@lru_cache(maxsize=8)
 def _build_pygments_formatter(style: str | None, *, nowrap: bool) -> HtmlFormatter:
-    """Build a Pygments HTML formatter.
+    """Build a Pygments HTML formatter, cached per (style, nowrap).
+
+    The formatter is effectively immutable for our usage, so sharing an
+    instance across rebuilds (e.g. in serve mode) is safe and avoids
+    rebuilding the Pygments style table every time.
 
     Args:
         style: Optional Pygments style name.
@@ -95,6 +182,9 @@ def _build_pygments_formatter(style: str | None, *, nowrap: bool) -> HtmlFormatt
     Returns:
         HtmlFormatter configured for the requested style.
     """
+    from pygments.formatters import HtmlFormatter  # type: ignore
+    from pygments.util import ClassNotFound
+
     resolved_style = style or "monokai"
     try:
         return HtmlFormatter(style=resolved_style, nowrap=nowrap)
@@ -105,8 +195,13 @@ def _build_pygments_formatter(style: str | None, *, nowrap: bool) -> HtmlFormatt
         return HtmlFormatter(style="monokai", nowrap=nowrap)
 
 
+@lru_cache(maxsize=8)
 def _build_pygments_css(style: str | None) -> str:
-    """Build CSS for Pygments-highlighted code blocks.
+    """Build CSS for Pygments-highlighted code blocks, cached per style.
+
+    Styles shipped in assets/pygments/ (regenerated with
+    scripts/generate_pygments_css.py) are read straight from disk,
+    bypassing Pygments entirely for the common case.
 
     Args:
         style: Optional Pygments style name.
@@ -114,6 +209,10 @@ def _build_pygments_css(style: str | None) -> str:
     Returns:
         CSS string.
     """
+    prerendered = get_assets_dir() / "pygments" / f"{style or 'monokai'}.css"
+    if prerendered.is_file():
+        return prerendered.read_bytes().decode("utf-8")
+
     formatter = _build_pygments_formatter(style, nowrap=True)
     return formatter.get_style_defs("pre code")
 
@@ -144,106 +243,154 @@ def _create_code_highlighter(
     Returns:
         A callable that highlights code blocks.
     """
-    formatter: HtmlFormatter | None = None
 
     def highlight_code(code: str, lang: str, attrs: str) -> str:
         """Highlight code blocks with Pygments when enabled."""
-        nonlocal formatter
         if highlight_style is None:
             return ""
 
-        if formatter is None:
-            formatter = _build_pygments_formatter(highlight_style, nowrap=True)
+        from pygments import highlight as pygments_highlight
 
-        lexer = TextLexer()
-        if lang:
-            try:
-                lexer = get_lexer_by_name(lang)
-            except ClassNotFound:
-                logger.debug(
-                    "Unknown code language '%s'. Falling back to text lexer.", lang
-                )
+        formatter = _build_pygments_formatter(highlight_style, nowrap=True)
+        lexer = (_get_lexer(lang) if lang else None) or _get_text_lexer()
 
         return pygments_highlight(code, lexer, formatter)
 
     return highlight_code
 
 
-def parse_markdown_to_slides(
-    markdown_content: str,
-    *,
-    highlight_style: str | None = None,
-) -> list[str]:
-    """Parse markdown content into individual slides, separated by ---.
+@lru_cache(maxsize=4)
+def _get_markdown_parser(highlight_style: str | None) -> MarkdownIt:
+    """Build a configured markdown-it parser, cached per highlight style.
 
-    Slides are separated by --- at the start of a line (with optional whitespace).
-    This ensures table separators and other inline --- don't accidentally split slides.
-    Code blocks (fenced with ```) are protected from splitting.
+    Plugin registration walks and registers rules on every construction,
+    which serve mode would otherwise pay on each rebuild. ``render()``
+    creates a fresh env dict per call, so sharing the instance is safe.
 
     Args:
-        markdown_content: Raw markdown content
+        highlight_style: Optional Pygments style name.
 
     Returns:
-        List of HTML slides
+        A MarkdownIt instance with tables, front matter and math enabled.
     """
-    # Split slides while respecting code blocks
-    slides_raw = _split_slides_respecting_code_blocks(markdown_content)
-    slides: list[str] = []
+    from markdown_it import MarkdownIt
+    from mdit_py_plugins.dollarmath import dollarmath_plugin
+    from mdit_py_plugins.front_matter import front_matter_plugin
 
-    # Create highlighter function
     highlight_code = _create_code_highlighter(highlight_style)
 
-    # Initialize markdown-it with plugins
     # Use default preset and explicitly enable tables
-    md = (
+    return (
         MarkdownIt("default", options_update={"highlight": highlight_code})
         .enable("table")
         .use(front_matter_plugin)
         .use(dollarmath_plugin, renderer=_math_renderer)
     )
 
-    for slide_content in slides_raw:
-        slide_content = slide_content.strip()
-        if slide_content:
-            # Convert markdown to HTML
-            html = md.render(slide_content)
-            slides.append(html)
 
-    return slides
+def parse_markdown_to_slides(
+    markdown_content: str,
+    *,
+    highlight_style: str | None = None,
+    start: int = 0,
+) -> list[str]:
+    """Parse markdown content into individual slides, separated by ---.
 
+    Slides are separated by --- at the start of a line (with optional whitespace).
+    This ensures table separators and other inline --- don't accidentally split slides.
+    Code blocks (fenced with ```) are protected from splitting.
 
-def _split_slides_respecting_code_blocks(content: str) -> list[str]:
+    Args:
+        markdown_content: Raw markdown content
+        highlight_style: Optional Pygments style name
+        start: Offset to parse from (e.g. past already-consumed front matter)
+
+    Returns:
+        List of HTML slides
+    """
+    # Fast path: no separator candidates at all means a single slide,
+    # so skip the boundary scan entirely.
+    if markdown_content.find("---", start) == -1:
+        body = markdown_content[start:].strip()
+        if not body:
+            return []
+        return [_get_markdown_parser(highlight_style).render(body)]
+
+    # Split slides while respecting code blocks; strip once and drop
+    # the empties in the same pass.
+    slides_raw = [
+        slide
+        for slide in map(
+            str.strip, _split_slides_respecting_code_blocks(markdown_content, start)
+        )
+        if slide
+    ]
+    if not slides_raw:
+        return []
+
+    md = _get_markdown_parser(highlight_style)
+
+    # Render all slides in a single markdown-it pass, separated by a
+    # sentinel paragraph, and split the resulting HTML. Fall back to
+    # per-slide rendering in the unlikely case the sentinel appears in
+    # the source.
+    if len(slides_raw) == 1 or _SLIDE_SENTINEL in markdown_content:
+        return [md.render(slide) for slide in slides_raw]
+
+    joined = f"\n\n{_SLIDE_SENTINEL}\n\n".join(slides_raw)
+    rendered = md.render(joined).split(_SLIDE_SENTINEL_HTML)
+    if len(rendered) != len(slides_raw):
+        # A slide swallowed a sentinel (e.g. an unclosed code fence), so
+        # the marker never rendered as its own paragraph; render each
+        # slide separately rather than leak the sentinel into the output.
+        return [md.render(slide) for slide in slides_raw]
+    return rendered
+
+
+# Unique marker used to batch-render all slides in one markdown-it pass;
+# it renders as a standalone paragraph the HTML can be split on.
+_SLIDE_SENTINEL = "SLIDR-SLIDE-SPLIT-9F3A"
+_SLIDE_SENTINEL_HTML = f"<p>{_SLIDE_SENTINEL}</p>"
+
+# Matches either an entire fenced code block or a slide separator line.
+# Fenced blocks are matched first so separators inside them are consumed
+# rather than treated as slide boundaries. A fence left unclosed (e.g. a
+# deck saved mid-edit in serve mode) consumes to end-of-input, matching
+# the line scanner this replaced, which stayed "inside" the block.
+_SLIDE_BOUNDARY_RE = re.compile(
+    r"^(?:[ \t]*```[^\n]*\n.*?(?:^[ \t]*```[^\n]*$|\Z)|\s*---\s*$)",
+    re.MULTILINE | re.DOTALL,
+)
+
+
+def _split_slides_respecting_code_blocks(content: str, start: int = 0) -> list[str]:
     """Split markdown content on --- while ignoring those inside code blocks.
 
+    A single pre-compiled regex scan walks the document once instead of
+    running two regex matches per line in a Python loop, so slides are
+    direct slices of the original string.
+
     Args:
         content: Markdown content to split.
+        start: Offset to scan from.
 
     Returns:
         List of slide content strings.
     """
-    lines = content.split("\n")
     slides: list[str] = []
-    current_slide: list[str] = []
-    in_code_block = False
-    code_fence_pattern = re.compile(r"^\s*```")
-
-    for line in lines:
-        # Check if we're entering/exiting a code block
-        if code_fence_pattern.match(line):
-            in_code_block = not in_code_block
-            current_slide.append(line)
-        # Check for slide separator (only outside code blocks)
-        elif not in_code_block and re.match(r"^\s*---\s*$", line):
-            # This is a slide separator
-            if current_slide:
-                slides.append("\n".join(current_slide))
-                current_slide = []
-        else:
-            current_slide.append(line)
-
-    # Add the last slide if there's content
-    if current_slide:
-        slides.append("\n".join(current_slide))
+    prev_end = start
+
+    for match in _SLIDE_BOUNDARY_RE.finditer(content, start):
+        if match.group().lstrip().startswith("```"):
+            # Fenced code block: consumed only so separators inside it
+            # don't split slides.
+            continue
+        slides.append(content[prev_end : match.start()])
+        prev_end = match.end()
+
+    # Add the trailing slide; whitespace-only chunks are dropped by the
+    # caller's strip-and-filter pass.
+    slides.append(content[prev_end:])
 
     return slides
 
@@ -260,13 +407,21 @@ def _find_markdown_file(deck_dir: Path) -> Path:
     Raises:
         FileNotFoundError: If no markdown file is found.
     """
-    md_files = list(deck_dir.glob("*.md"))
-
-    if not md_files:
+    md_file = None
+    other_files = []
+    # A single scandir pass avoids the per-entry stat and Path
+    # allocation that Path.glob does for non-markdown siblings.
+    with os.scandir(deck_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".md") and entry.is_file():
+                if md_file is None:
+                    md_file = Path(entry.path)
+                else:
+                    other_files.append(entry.name)
+
+    if md_file is None:
         raise FileNotFoundError(f"No markdown file found in {deck_dir}")
 
-    md_file = md_files[0]
-
     # Warn if picking up common non-deck files
     if md_file.name.lower() in COMMON_NON_DECK_FILES:
         logger.warning(f"⚠️  Using '{md_file.name}' - this may not be a slide deck file")
@@ -279,8 +434,7 @@ def _find_markdown_file(deck_dir: Path) -> Path:
     logger.debug(f"📄 Building from: {md_file.name}")
 
     # Warn if multiple markdown files exist
-    if len(md_files) > 1:
-        other_files = [f.name for f in md_files if f != md_file]
+    if other_files:
         logger.warning(
             f"Multiple markdown files found. Using '{md_file.name}'. "
             f"Others: {', '.join(other_files)}"
@@ -359,7 +513,7 @@ def _build_full_css_content(
     Returns:
         Complete CSS content.
     """
-    css_content = theme_path.read_text(encoding="utf-8")
+    css_content = theme_path.read_bytes().decode("utf-8")
 
     if highlight_style is not None:
         pygments_css = _build_pygments_css(highlight_style)
@@ -395,7 +549,7 @@ def _extract_page_metadata(front_matter: dict | None) -> tuple[str, str]:
         raw_alignment = front_matter.get("align")
         if raw_alignment is not None:
             alignment_value = str(raw_alignment).strip().lower()
-            if alignment_value in {"left", "center", "right"}:
+            if alignment_value in _VALID_ALIGNMENTS:
                 alignment = alignment_value
             else:
                 logger.warning(
@@ -407,6 +561,32 @@ def _extract_page_metadata(front_matter: dict | None) -> tuple[str, str]:
     return page_title, alignment
 
 
+@lru_cache(maxsize=1)
+def _get_template_env():
+    """Build the Jinja environment for the templates directory, cached.
+
+    The environment keeps compiled templates in its internal cache and,
+    with ``auto_reload``, revalidates them against the file mtime — so
+    repeat builds skip re-parsing slides.html while template edits are
+    still picked up.
+
+    Returns:
+        The shared jinja2.Environment.
+    """
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+    return Environment(
+        loader=FileSystemLoader(str(get_templates_dir())),
+        autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=True,
+    )
+
+
+def _get_slides_template():
+    """Load the compiled slides template from the shared environment."""
+    return _get_template_env().get_template("slides.html")
+
+
 def _render_slides_template(
     page_title: str,
     slides: list[str],
@@ -426,11 +606,7 @@ def _render_slides_template(
     Returns:
         Complete HTML content.
     """
-    env = Environment(
-        loader=FileSystemLoader(str(get_templates_dir())),
-        autoescape=select_autoescape(["html", "xml"]),
-    )
-    template = env.get_template("slides.html")
+    template = _get_slides_template()
 
     build_id = str(int(time.time() * 1000))
 
@@ -469,14 +645,15 @@ def build_deck(args: argparse.Namespace) -> int:
 
     md_file = _find_markdown_file(deck_dir)
 
-    markdown_content = md_file.read_text(encoding="utf-8")
+    markdown_content = md_file.read_bytes().decode("utf-8")
 
-    front_matter, content_without_front_matter = extract_front_matter(markdown_content)
+    front_matter, body_start = _match_front_matter(markdown_content)
 
     highlight_style = _resolve_code_highlight_style(front_matter)
     slides = parse_markdown_to_slides(
-        content_without_front_matter,
+        markdown_content,
         highlight_style=highlight_style,
+        start=body_start,
     )
 
     theme_path = _resolve_theme(args, deck_dir, front_matter)
@@ -490,9 +667,9 @@ def build_deck(args: argparse.Namespace) -> int:
         page_title, slides, css_content, alignment, live_reload
     )
 
-    # Write output
+    # Write output (encode once, skip text-mode newline translation)
     output_file = Path(args.output) if args.output else deck_dir / "index.html"
-    output_file.write_text(html_content, encoding="utf-8")
+    output_file.write_bytes(html_content.encode("utf-8"))
 
     logger.info(f"✓ Built slides: {output_file}")
 
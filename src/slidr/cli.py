@@ -1,7 +1,7 @@
 import argparse
 
 from . import build, new, serve, themes
-from .logging_utils import get_logger
+from .logging_utils import configure_logging, get_logger
 
 logger = get_logger(__name__)
 
@@ -75,6 +75,7 @@ def create_parser():
 
 def main(args=None):
     """Main CLI entry point."""
+    configure_logging()
     parser = create_parser()
     parsed_args = parser.parse_args(args)
 
@@ -2,23 +2,24 @@
 
 import logging
 
-from rich.console import Console
-from rich.logging import RichHandler
-
-# Create a console for rich output
-console = Console(stderr=False, force_terminal=True)
-
 
 def configure_logging(level: int = logging.INFO, verbose: bool = True) -> None:
     """Configure the root logger with Rich handler for beautiful output.
 
+    Rich is imported here rather than at module level so that importing
+    slidr (e.g. for library use) stays cheap; the CLI entry point calls
+    this before dispatching commands.
+
     Args:
         level: Logging level (default: INFO)
         verbose: If True, use verbose format with timestamps and paths
     """
+    from rich.console import Console
+    from rich.logging import RichHandler
+
     # Configure Rich handler
     rich_handler = RichHandler(
-        console=console,
+        console=Console(stderr=False, force_terminal=True),
         show_time=verbose,
         show_path=verbose,
         show_level=True,
@@ -51,7 +52,3 @@ def get_logger(name: str, level: int | None = None) -> logging.Logger:
         logger.setLevel(level)
 
     return logger
-
-
-# Initialize default configuration when module is imported
-configure_logging()
@@ -1,8 +1,14 @@
 """Main entry point for the slidr CLI."""
 
+import sys
+
 from .cli import main
 
-if __name__ == "__main__":
-    import sys
 
+def run() -> None:
+    """Run the CLI and exit the process with its return code."""
     sys.exit(main())
+
+
+if __name__ == "__main__":
+    run()
@@ -47,9 +47,10 @@ Your second slide content here.
 Your third slide content here.
 """)
 
-    # Copy default theme
+    # Copy default theme (copyfile skips the permission-bit copying of
+    # shutil.copy and uses fast OS-level copy paths where available)
     theme_file = deck_dir / "theme.css"
-    shutil.copy(get_default_theme_path(), theme_file)
+    shutil.copyfile(get_default_theme_path(), theme_file)
 
     logger.info(f"✓ Project initialized at {project_dir}")
     logger.info(f"✓ Created deck folder with {args.markdown} and theme.css")
@@ -1,14 +1,23 @@
 """Serve deck with file watching and auto-rebuild."""
 
+from __future__ import annotations
+
 import argparse
+import hashlib
 import os
 import time
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from functools import lru_cache
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from threading import Thread
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+# watchfiles is imported lazily so other CLI commands don't pay its
+# import cost; cli.py imports this module unconditionally.
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-from watchfiles import watch
+    from watchfiles import Change, DefaultFilter
 
 from .build import build_deck
 from .logging_utils import get_logger
@@ -16,6 +25,76 @@ from .logging_utils import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_watch_filter() -> DefaultFilter:
+    """Build the deck watch filter, importing watchfiles on first use.
+
+    The filter extends watchfiles' DefaultFilter (which already ignores
+    VCS internals, caches and common editor temp files) to also skip the
+    build output and anything that isn't a deck source file.
+
+    Returns:
+        A filter instance suitable for watchfiles.watch.
+    """
+    from watchfiles import DefaultFilter
+
+    class DeckFilter(DefaultFilter):
+        """Watch filter that only passes events relevant to a rebuild."""
+
+        allowed_extensions = (".md", ".css", ".html", ".yaml", ".yml")
+
+        def __call__(self, change: Change, path: str) -> bool:
+            name = os.path.basename(path)
+            return (
+                super().__call__(change, path)
+                and name != "index.html"
+                and name.endswith(self.allowed_extensions)
+            )
+
+    return DeckFilter()
+
+
+def _deck_snapshot(deck_dir: Path, theme: str | None) -> tuple | None:
+    """Fingerprint the build inputs (markdown and CSS files) of a deck.
+
+    Args:
+        deck_dir: Path to the deck directory.
+        theme: Optional path to a custom CSS theme.
+
+    Returns:
+        A hashable tuple of (name, digest) pairs, or None when the
+        snapshot cannot be computed (callers should rebuild in that case).
+    """
+    try:
+        entries = []
+        for path in sorted(deck_dir.iterdir()):
+            if path.suffix in {".md", ".css"} and path.is_file():
+                digest = hashlib.blake2b(path.read_bytes(), digest_size=8).digest()
+                entries.append((path.name, digest))
+        if theme:
+            theme_path = Path(theme)
+            if theme_path.is_file():
+                digest = hashlib.blake2b(
+                    theme_path.read_bytes(), digest_size=8
+                ).digest()
+                entries.append((str(theme_path), digest))
+        return tuple(entries)
+    except OSError:
+        return None
+
+
+class DeckServer(ThreadingHTTPServer):
+    """Threaded HTTP server tuned for local development.
+
+    Threading lets the browser fetch CSS and other assets concurrently,
+    and reusing the address avoids bind errors from TIME_WAIT sockets
+    when the server is restarted quickly.
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+
 class QuietRequestHandler(SimpleHTTPRequestHandler):
     """HTTP handler that suppresses access logs."""
 
@@ -42,7 +121,9 @@ def create_build_args(deck_dir: Path, theme: str | None) -> argparse.Namespace:
     )
 
 
-def serve_deck(args: argparse.Namespace) -> int:
+def serve_deck(
+    args: argparse.Namespace, *, clock: Callable[[], float] = time.time
+) -> int:
     """
     Serve deck with file watching and auto-rebuild.
 
@@ -51,6 +132,8 @@ def serve_deck(args: argparse.Namespace) -> int:
             - deck: Path to the deck folder
             - port: Port to serve on
             - theme: Optional path to custom CSS theme
+        clock: Time source used for rebuild debouncing; tests inject a
+            deterministic one.
 
     Returns:
         Exit code (0 for success)
@@ -75,25 +158,37 @@ def serve_deck(args: argparse.Namespace) -> int:
     # Start server in background
     os.chdir(deck_dir)
 
-    server = HTTPServer(("localhost", args.port), QuietRequestHandler)
+    server = DeckServer(("localhost", args.port), QuietRequestHandler)
     server_thread = Thread(target=server.serve_forever, daemon=True)
     server_thread.start()
 
     # Watch for changes
+    from watchfiles import watch
+
     def rebuild_on_changes() -> None:
         """Watch for file changes and rebuild when detected."""
-        last_build = time.time()
-        for _ in watch(str(deck_dir), watch_filter=lambda *_: True):
-            current_time = time.time()
+        last_build = clock()
+        last_snapshot = _deck_snapshot(deck_dir, args.theme)
+        for _ in watch(str(deck_dir), watch_filter=_get_watch_filter()):
+            current_time = clock()
             # Debounce: only rebuild if at least 1 second has passed
-            if current_time - last_build >= 1:
-                logger.info("🔄 Changes detected, rebuilding...")
-                try:
-                    build_args = create_build_args(deck_dir, args.theme)
-                    build_deck(build_args)
-                    last_build = current_time
-                except Exception as e:
-                    logger.error(f"❌ Build failed: {e}")
+            if current_time - last_build < 1:
+                continue
+
+            # Skip rebuilds when the build inputs are unchanged (e.g.
+            # spurious events from editors or the output file itself)
+            snapshot = _deck_snapshot(deck_dir, args.theme)
+            if snapshot is not None and snapshot == last_snapshot:
+                continue
+
+            logger.info("🔄 Changes detected, rebuilding...")
+            try:
+                build_args = create_build_args(deck_dir, args.theme)
+                build_deck(build_args)
+                last_build = current_time
+                last_snapshot = snapshot
+            except Exception as e:
+                logger.error(f"❌ Build failed: {e}")
 
     try:
         rebuild_on_changes()
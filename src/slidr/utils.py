@@ -1,19 +1,36 @@
 """Common utility functions for Slidr."""
 
+import os
+from functools import cache
 from pathlib import Path
 
 
+@cache
 def get_assets_dir() -> Path:
     """Get the path to the assets directory."""
     package_dir = Path(__file__).parent
     return package_dir / "assets"
 
 
+@cache
 def get_default_theme_path() -> Path:
     """Get the path to the default CSS theme."""
     return get_assets_dir() / "default.css"
 
 
+@cache
+def _find_asset_theme(theme_name: str) -> Path | None:
+    """Look up a built-in theme in the packaged assets directory.
+
+    Packaged assets never change at runtime, so the existence check is
+    memoized; deck-local themes are deliberately not cached because the
+    user can add or remove them between rebuilds in serve mode.
+    """
+    asset_theme = os.path.join(get_assets_dir(), theme_name)
+    return Path(asset_theme) if os.path.exists(asset_theme) else None
+
+
+@cache
 def get_templates_dir() -> Path:
     """Get the path to the templates directory."""
     package_dir = Path(__file__).parent
@@ -40,21 +57,16 @@ def resolve_theme_path(theme_name: str, deck_dir: Path | None = None) -> Path |
     if not theme_name.endswith(".css"):
         theme_name = f"{theme_name}.css"
 
-    theme_path = Path(theme_name)
-
-    # Check if it's an absolute path
-    if theme_path.is_absolute() and theme_path.exists():
-        return theme_path
+    # The candidate checks run on plain strings (one C-level stat each);
+    # Path objects are only built for the returned value.
+    if os.path.isabs(theme_name) and os.path.exists(theme_name):
+        return Path(theme_name)
 
     # Check in deck directory
     if deck_dir:
-        deck_theme = deck_dir / theme_name
-        if deck_theme.exists():
-            return deck_theme
+        deck_theme = os.path.join(deck_dir, theme_name)
+        if os.path.exists(deck_theme):
+            return Path(deck_theme)
 
     # Check in assets directory (built-in themes)
-    asset_theme = get_assets_dir() / theme_name
-    if asset_theme.exists():
-        return asset_theme
-
-    return None
+    return _find_asset_theme(theme_name)
@@ -1,10 +1,25 @@
 """Shared pytest fixtures for slidr tests."""
 
+import argparse
 from pathlib import Path
 
 import pytest
 
 
+@pytest.fixture(scope="session")
+def cli_parser() -> argparse.ArgumentParser:
+    """Session-wide CLI parser.
+
+    Building the subparser tree is comparatively expensive and the tests
+    only ever call parse_args on it, so one shared instance suffices.
+    The import happens here rather than at module top so collect-only
+    runs don't initialize the slidr package.
+    """
+    from slidr.cli import create_parser
+
+    return create_parser()
+
+
 @pytest.fixture
 def temp_project_dir(tmp_path: Path) -> Path:
     """Create a temporary project directory."""
@@ -13,15 +28,7 @@ def temp_project_dir(tmp_path: Path) -> Path:
     return project_dir
 
 
-@pytest.fixture
-def temp_deck_dir(tmp_path: Path) -> Path:
-    """Create a temporary deck directory with a markdown file."""
-    deck_dir = tmp_path / "deck"
-    deck_dir.mkdir()
-
-    # Create a sample markdown file
-    md_file = deck_dir / "deck.md"
-    md_file.write_text("""# Slide 1
+_SAMPLE_DECK_MARKDOWN = """# Slide 1
 First slide content.
 
 ---
@@ -33,11 +40,40 @@ Second slide content.
 
 # Slide 3
 Third slide content.
-""")
+"""
 
+
+@pytest.fixture
+def temp_deck_dir(tmp_path: Path) -> Path:
+    """Create a temporary deck directory with a markdown file."""
+    deck_dir = tmp_path / "deck"
+    deck_dir.mkdir()
+    (deck_dir / "deck.md").write_text(_SAMPLE_DECK_MARKDOWN)
     return deck_dir
 
 
+@pytest.fixture(scope="session")
+def temp_deck_dir_ro(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-wide deck directory for tests that never write into it.
+
+    Materialized once per run; tests that mutate the deck (rebuild-on-change,
+    build output) must keep using the function-scoped temp_deck_dir.
+    """
+    deck_dir = tmp_path_factory.mktemp("deck_ro")
+    (deck_dir / "deck.md").write_text(_SAMPLE_DECK_MARKDOWN)
+    return deck_dir
+
+
+@pytest.fixture(scope="session")
+def temp_deck_dir_ro_resolved(temp_deck_dir_ro: Path) -> Path:
+    """Resolved form of temp_deck_dir_ro, computed once per session.
+
+    Path.resolve() stats every component to follow symlinks; tests that
+    compare against the resolved deck path share this cached value.
+    """
+    return temp_deck_dir_ro.resolve()
+
+
 @pytest.fixture
 def temp_deck_dir_with_theme(temp_deck_dir: Path) -> Path:
     """Create a temporary deck directory with markdown and custom theme."""
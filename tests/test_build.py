@@ -1,6 +1,7 @@
 """Tests for build.py module."""
 
 import argparse
+import importlib.resources
 import logging
 from pathlib import Path
 
@@ -8,6 +9,7 @@ import pytest
 from pygments.formatters import HtmlFormatter  # type: ignore
 
 from slidr.build import (
+    LOGGER_NAME,
     _build_pygments_css,
     _build_pygments_formatter,
     _resolve_code_highlight_style,
@@ -37,9 +39,9 @@ class TestGetDefaultThemePath:
         assert result.parent.name == "assets"
 
     def test_default_theme_exists(self):
-        """Should return a path that exists."""
-        result = get_default_theme_path()
-        assert result.exists()
+        """Should point at a packaged resource that exists."""
+        resource = importlib.resources.files("slidr") / "assets" / "default.css"
+        assert resource.is_file()
 
 
 class TestGetTemplatesDir:
@@ -94,6 +96,21 @@ class TestParseMarkdownToSlides:
         # Should have 2 slides, not 3 (empty slide filtered out)
         assert len(result) == 2
 
+    def test_unclosed_code_fence_does_not_split(self):
+        """Should keep --- inside an unclosed code fence (e.g. saved mid-edit)."""
+        markdown = "# A\n\n```\ncode\n---\nstill code?\n"
+        result = parse_markdown_to_slides(markdown)
+        assert len(result) == 1
+        assert "still code?" in result[0]
+
+    def test_batch_render_never_leaks_sentinel(self):
+        """Should fall back to per-slide rendering when a slide swallows
+        the batch sentinel (e.g. an unterminated HTML block)."""
+        markdown = "<pre>\nnot closed\n\n---\n\n# B\n"
+        result = parse_markdown_to_slides(markdown)
+        assert len(result) == 2
+        assert all("SLIDR-SLIDE-SPLIT" not in slide for slide in result)
+
     def test_strips_whitespace_from_slides(self):
         """Should strip whitespace from slide content before processing."""
         markdown = "   # Slide 1   \n---\n   # Slide 2   "
@@ -464,7 +481,7 @@ class TestBuildDeck:
         self, temp_deck_dir: Path, caplog: pytest.LogCaptureFixture
     ):
         """Should warn and fall back when CLI theme is missing."""
-        caplog.set_level(logging.WARNING, logger="slidr.build")
+        caplog.set_level(logging.WARNING, logger=LOGGER_NAME)
         args = argparse.Namespace(
             deck=str(temp_deck_dir), output=None, theme="missing-theme.css"
         )
@@ -486,7 +503,7 @@ theme: missing-theme
 # Slide
 """)
 
-        caplog.set_level(logging.WARNING, logger="slidr.build")
+        caplog.set_level(logging.WARNING, logger=LOGGER_NAME)
         args = argparse.Namespace(deck=str(deck_dir), output=None, theme=None)
 
         build_deck(args)
@@ -528,7 +545,7 @@ align: sideways
 # Slide
 """)
 
-        caplog.set_level(logging.WARNING, logger="slidr.build")
+        caplog.set_level(logging.WARNING, logger=LOGGER_NAME)
         args = argparse.Namespace(deck=str(deck_dir), output=None, theme=None)
 
         build_deck(args)
@@ -638,7 +655,7 @@ align: right
         deck_dir.mkdir()
         (deck_dir / "README.md").write_text("# Welcome\n\n---\n\n# Slide 2")
 
-        caplog.set_level(logging.WARNING, logger="slidr.build")
+        caplog.set_level(logging.WARNING, logger=LOGGER_NAME)
         args = argparse.Namespace(deck=str(deck_dir), output=None, theme=None)
 
         build_deck(args)
@@ -752,10 +769,10 @@ The end.
     content = output_file.read_text(encoding="utf-8")
 
     # Count actual slide divs (not slide-container or slide-counter)
-    import re
-
-    slide_divs = re.findall(r'<div class="slide (?:active|)">', content)
-    assert len(slide_divs) == 7, f"Expected 7 slides, but found {len(slide_divs)}"
+    slide_count = content.count('<div class="slide active">') + content.count(
+        '<div class="slide ">'
+    )
+    assert slide_count == 7, f"Expected 7 slides, but found {slide_count}"
 
     # Verify key content is present and not split incorrectly
     assert "Slide 1: Introduction" in content
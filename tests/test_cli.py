@@ -1,67 +1,54 @@
 """Tests for cli.py module."""
 
 import argparse
+import sys
 from unittest.mock import patch
 
 import pytest
 
-from slidr.cli import create_parser, main
+from slidr.cli import main
 
 
 class TestCreateParser:
     """Tests for create_parser function."""
 
-    def test_returns_argument_parser(self):
+    def test_returns_argument_parser(self, cli_parser):
         """Should return an ArgumentParser object."""
-        parser = create_parser()
-        assert isinstance(parser, argparse.ArgumentParser)
+        assert isinstance(cli_parser, argparse.ArgumentParser)
 
-    def test_parser_has_command_subparsers(self):
+    def test_parser_has_command_subparsers(self, cli_parser):
         """Should have subparsers for commands."""
-        parser = create_parser()
         # Parser should have subparsers
-        args = parser.parse_args([])
+        args = cli_parser.parse_args([])
         # No command specified means func attribute won't exist
         assert not hasattr(args, "func") or args.command is None
 
-    @pytest.mark.parametrize("command", ["new", "build", "serve", "themes"])
-    def test_parser_supports_all_commands(self, command: str):
+    def test_parser_supports_all_commands(self, cli_parser):
         """Should support new, build, serve, and themes commands."""
-        parser = create_parser()
-
-        # Each command should parse without error
-        if command == "new":
-            args = parser.parse_args([command, "test_project"])
-            assert args.command == command
-        elif command == "build" or command == "serve":
-            args = parser.parse_args([command])
-            assert args.command == command
-        else:  # themes
-            args = parser.parse_args([command])
-            assert args.command == command
+        # Each command should parse without error ("new" needs a project)
+        for argv in (["new", "test_project"], ["build"], ["serve"], ["themes"]):
+            args = cli_parser.parse_args(argv)
+            assert args.command == argv[0]
 
 
 class TestNewCommand:
     """Tests for new command parser."""
 
-    def test_new_requires_project_argument(self):
+    def test_new_requires_project_argument(self, cli_parser):
         """Should require project argument."""
-        parser = create_parser()
 
         with pytest.raises(SystemExit):
-            parser.parse_args(["new"])
+            cli_parser.parse_args(["new"])
 
-    def test_new_parses_project_name(self):
+    def test_new_parses_project_name(self, cli_parser):
         """Should parse project name argument."""
-        parser = create_parser()
-        args = parser.parse_args(["new", "my_project"])
+        args = cli_parser.parse_args(["new", "my_project"])
 
         assert args.project == "my_project"
 
-    def test_new_has_default_markdown_name(self):
+    def test_new_has_default_markdown_name(self, cli_parser):
         """Should have default markdown file name."""
-        parser = create_parser()
-        args = parser.parse_args(["new", "test"])
+        args = cli_parser.parse_args(["new", "test"])
 
         assert args.markdown == "deck.md"
 
@@ -73,17 +60,15 @@ class TestNewCommand:
             "my_deck.md",
         ],
     )
-    def test_new_accepts_custom_markdown_name(self, markdown_name: str):
+    def test_new_accepts_custom_markdown_name(self, cli_parser, markdown_name: str):
         """Should accept custom markdown file name with --markdown flag."""
-        parser = create_parser()
-        args = parser.parse_args(["new", "test", "--markdown", markdown_name])
+        args = cli_parser.parse_args(["new", "test", "--markdown", markdown_name])
 
         assert args.markdown == markdown_name
 
-    def test_new_has_func_attribute(self):
+    def test_new_has_func_attribute(self, cli_parser):
         """Should have func attribute set to init_project."""
-        parser = create_parser()
-        args = parser.parse_args(["new", "test"])
+        args = cli_parser.parse_args(["new", "test"])
 
         assert hasattr(args, "func")
         assert args.func.__name__ == "init_project"
@@ -92,24 +77,21 @@ class TestNewCommand:
 class TestBuildCommand:
     """Tests for build command parser."""
 
-    def test_build_has_default_deck_path(self):
+    def test_build_has_default_deck_path(self, cli_parser):
         """Should have default deck path as current directory."""
-        parser = create_parser()
-        args = parser.parse_args(["build"])
+        args = cli_parser.parse_args(["build"])
 
         assert args.deck == "."
 
-    def test_build_accepts_deck_argument(self):
+    def test_build_accepts_deck_argument(self, cli_parser):
         """Should accept deck path argument."""
-        parser = create_parser()
-        args = parser.parse_args(["build", "my_deck"])
+        args = cli_parser.parse_args(["build", "my_deck"])
 
         assert args.deck == "my_deck"
 
-    def test_build_output_default_is_none(self):
+    def test_build_output_default_is_none(self, cli_parser):
         """Should have None as default output."""
-        parser = create_parser()
-        args = parser.parse_args(["build"])
+        args = cli_parser.parse_args(["build"])
 
         assert args.output is None
 
@@ -121,17 +103,15 @@ class TestBuildCommand:
             "dist/index.html",
         ],
     )
-    def test_build_accepts_output_flag(self, output_path: str):
+    def test_build_accepts_output_flag(self, cli_parser, output_path: str):
         """Should accept --output flag."""
-        parser = create_parser()
-        args = parser.parse_args(["build", "--output", output_path])
+        args = cli_parser.parse_args(["build", "--output", output_path])
 
         assert args.output == output_path
 
-    def test_build_theme_default_is_none(self):
+    def test_build_theme_default_is_none(self, cli_parser):
         """Should have None as default theme."""
-        parser = create_parser()
-        args = parser.parse_args(["build"])
+        args = cli_parser.parse_args(["build"])
 
         assert args.theme is None
 
@@ -143,17 +123,15 @@ class TestBuildCommand:
             "my_theme.css",
         ],
     )
-    def test_build_accepts_theme_flag(self, theme_path: str):
+    def test_build_accepts_theme_flag(self, cli_parser, theme_path: str):
         """Should accept --theme flag."""
-        parser = create_parser()
-        args = parser.parse_args(["build", "--theme", theme_path])
+        args = cli_parser.parse_args(["build", "--theme", theme_path])
 
         assert args.theme == theme_path
 
-    def test_build_accepts_multiple_flags(self):
+    def test_build_accepts_multiple_flags(self, cli_parser):
         """Should accept multiple flags together."""
-        parser = create_parser()
-        args = parser.parse_args(
+        args = cli_parser.parse_args(
             ["build", "my_deck", "--output", "out.html", "--theme", "theme.css"]
         )
 
@@ -161,10 +139,9 @@ class TestBuildCommand:
         assert args.output == "out.html"
         assert args.theme == "theme.css"
 
-    def test_build_has_func_attribute(self):
+    def test_build_has_func_attribute(self, cli_parser):
         """Should have func attribute set to build_deck."""
-        parser = create_parser()
-        args = parser.parse_args(["build"])
+        args = cli_parser.parse_args(["build"])
 
         assert hasattr(args, "func")
         assert args.func.__name__ == "build_deck"
@@ -173,53 +150,46 @@ class TestBuildCommand:
 class TestServeCommand:
     """Tests for serve command parser."""
 
-    def test_serve_has_default_deck_path(self):
+    def test_serve_has_default_deck_path(self, cli_parser):
         """Should have default deck path as current directory."""
-        parser = create_parser()
-        args = parser.parse_args(["serve"])
+        args = cli_parser.parse_args(["serve"])
 
         assert args.deck == "."
 
-    def test_serve_accepts_deck_argument(self):
+    def test_serve_accepts_deck_argument(self, cli_parser):
         """Should accept deck path argument."""
-        parser = create_parser()
-        args = parser.parse_args(["serve", "my_deck"])
+        args = cli_parser.parse_args(["serve", "my_deck"])
 
         assert args.deck == "my_deck"
 
-    def test_serve_has_default_port(self):
+    def test_serve_has_default_port(self, cli_parser):
         """Should have default port 8000."""
-        parser = create_parser()
-        args = parser.parse_args(["serve"])
+        args = cli_parser.parse_args(["serve"])
 
         assert args.port == 8000
 
     @pytest.mark.parametrize("port", [3000, 8080, 5000, 9000])
-    def test_serve_accepts_port_flag(self, port: int):
+    def test_serve_accepts_port_flag(self, cli_parser, port: int):
         """Should accept --port flag with integer value."""
-        parser = create_parser()
-        args = parser.parse_args(["serve", "--port", str(port)])
+        args = cli_parser.parse_args(["serve", "--port", str(port)])
 
         assert args.port == port
 
-    def test_serve_theme_default_is_none(self):
+    def test_serve_theme_default_is_none(self, cli_parser):
         """Should have None as default theme."""
-        parser = create_parser()
-        args = parser.parse_args(["serve"])
+        args = cli_parser.parse_args(["serve"])
 
         assert args.theme is None
 
-    def test_serve_accepts_theme_flag(self):
+    def test_serve_accepts_theme_flag(self, cli_parser):
         """Should accept --theme flag."""
-        parser = create_parser()
-        args = parser.parse_args(["serve", "--theme", "custom.css"])
+        args = cli_parser.parse_args(["serve", "--theme", "custom.css"])
 
         assert args.theme == "custom.css"
 
-    def test_serve_accepts_multiple_flags(self):
+    def test_serve_accepts_multiple_flags(self, cli_parser):
         """Should accept multiple flags together."""
-        parser = create_parser()
-        args = parser.parse_args(
+        args = cli_parser.parse_args(
             ["serve", "my_deck", "--port", "3000", "--theme", "theme.css"]
         )
 
@@ -227,10 +197,9 @@ class TestServeCommand:
         assert args.port == 3000
         assert args.theme == "theme.css"
 
-    def test_serve_has_func_attribute(self):
+    def test_serve_has_func_attribute(self, cli_parser):
         """Should have func attribute set to serve_deck."""
-        parser = create_parser()
-        args = parser.parse_args(["serve"])
+        args = cli_parser.parse_args(["serve"])
 
         assert hasattr(args, "func")
         assert args.func.__name__ == "serve_deck"
@@ -239,52 +208,39 @@ class TestServeCommand:
 class TestMain:
     """Tests for main function."""
 
-    def test_main_returns_0_for_successful_command(self, temp_deck_dir):
+    @pytest.fixture
+    def mock_build(self, mocker):
+        """Patch the build command handler."""
+        return mocker.patch("slidr.cli.build.build_deck", return_value=0)
+
+    def test_main_returns_0_for_successful_command(self, monkeypatch, temp_deck_dir):
         """Should return 0 when command executes successfully."""
-        with patch("slidr.cli.build.build_deck", return_value=0):
-            result = main(["build", str(temp_deck_dir)])
-            assert result == 0
+        monkeypatch.setattr("slidr.cli.build.build_deck", lambda args: 0)
+
+        result = main(["build", str(temp_deck_dir)])
+        assert result == 0
 
     def test_main_returns_1_when_no_command_provided(self):
         """Should return 1 when no command is provided."""
         result = main([])
         assert result == 1
 
-    def test_main_returns_1_on_command_exception(self, temp_deck_dir):
+    def test_main_returns_1_on_command_exception(self, monkeypatch, temp_deck_dir):
         """Should return 1 when command raises exception."""
-        with patch("slidr.cli.build.build_deck", side_effect=Exception("Test error")):
-            result = main(["build", str(temp_deck_dir)])
-            assert result == 1
+
+        def raise_error(args):
+            raise Exception("Test error")
+
+        monkeypatch.setattr("slidr.cli.build.build_deck", raise_error)
+
+        result = main(["build", str(temp_deck_dir)])
+        assert result == 1
 
     def test_main_catches_file_not_found_error(self):
         """Should catch FileNotFoundError and return 1."""
         result = main(["build", "/nonexistent/path"])
         assert result == 1
 
-    def test_main_calls_new_command(self):
-        """Should call new command function."""
-        with patch("slidr.cli.new.init_project", return_value=0) as mock_init:
-            result = main(["new", "test_project"])
-
-            mock_init.assert_called_once()
-            assert result == 0
-
-    def test_main_calls_build_command(self):
-        """Should call build command function."""
-        with patch("slidr.cli.build.build_deck", return_value=0) as mock_build:
-            result = main(["build"])
-
-            mock_build.assert_called_once()
-            assert result == 0
-
-    def test_main_calls_serve_command(self):
-        """Should call serve command function."""
-        with patch("slidr.cli.serve.serve_deck", return_value=0) as mock_serve:
-            result = main(["serve"])
-
-            mock_serve.assert_called_once()
-            assert result == 0
-
     @pytest.mark.parametrize(
         "command_args,expected_func,module_name",
         [
@@ -300,15 +256,16 @@ class TestMain:
         with patch(
             f"slidr.cli.{module_name}.{expected_func}", return_value=0
         ) as mock_func:
-            main(command_args)
+            result = main(command_args)
+
             mock_func.assert_called_once()
+            assert result == 0
 
-    def test_main_with_none_args_uses_sys_argv(self):
+    def test_main_with_none_args_uses_sys_argv(self, mock_build, monkeypatch):
         """Should use sys.argv when args is None."""
-        with (
-            patch("sys.argv", ["slidr", "build"]),
-            patch("slidr.cli.build.build_deck", return_value=0) as mock_build,
-        ):
-            result = main()
-            assert result == 0
-            mock_build.assert_called_once()
+        monkeypatch.setattr(sys, "argv", ["slidr", "build"])
+
+        result = main()
+
+        assert result == 0
+        mock_build.assert_called_once()
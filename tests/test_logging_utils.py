@@ -1,7 +1,6 @@
 """Tests for logging_utils.py module."""
 
 import logging
-from unittest.mock import patch
 
 import pytest
 
@@ -14,14 +13,18 @@ from slidr.logging_utils import (
 class TestConfigureLogging:
     """Tests for configure_logging function."""
 
-    def test_configures_logging_with_default_level(self):
+    @pytest.fixture(autouse=True)
+    def mock_basic(self, mocker):
+        """Patch logging.basicConfig for every test in the class."""
+        return mocker.patch("logging.basicConfig")
+
+    def test_configures_logging_with_default_level(self, mock_basic):
         """Should configure logging with INFO level by default."""
-        with patch("logging.basicConfig") as mock_basic_config:
-            configure_logging()
+        configure_logging()
 
-            mock_basic_config.assert_called_once()
-            call_kwargs = mock_basic_config.call_args[1]
-            assert call_kwargs["level"] == logging.INFO
+        mock_basic.assert_called_once()
+        call_kwargs = mock_basic.call_args[1]
+        assert call_kwargs["level"] == logging.INFO
 
     @pytest.mark.parametrize(
         "level,expected",
@@ -33,46 +36,37 @@ class TestConfigureLogging:
             (logging.CRITICAL, logging.CRITICAL),
         ],
     )
-    def test_configures_logging_with_custom_level(self, level: int, expected: int):
+    def test_configures_logging_with_custom_level(
+        self, mock_basic, level: int, expected: int
+    ):
         """Should configure logging with specified level."""
-        with patch("logging.basicConfig") as mock_basic_config:
-            configure_logging(level=level)
+        configure_logging(level=level)
 
-            call_kwargs = mock_basic_config.call_args[1]
-            assert call_kwargs["level"] == expected
+        call_kwargs = mock_basic.call_args[1]
+        assert call_kwargs["level"] == expected
 
-    def test_uses_rich_handler(self):
+    def test_uses_rich_handler(self, mock_basic):
         """Should use RichHandler for logging."""
-        with patch("logging.basicConfig") as mock_basic_config:
-            configure_logging()
+        configure_logging()
 
-            call_kwargs = mock_basic_config.call_args[1]
-            assert "handlers" in call_kwargs
-            handlers = call_kwargs["handlers"]
-            assert len(handlers) > 0
+        call_kwargs = mock_basic.call_args[1]
+        assert "handlers" in call_kwargs
+        handlers = call_kwargs["handlers"]
+        assert len(handlers) > 0
 
-    def test_forces_configuration(self):
+    def test_forces_configuration(self, mock_basic):
         """Should force reconfiguration of logging."""
-        with patch("logging.basicConfig") as mock_basic_config:
-            configure_logging()
+        configure_logging()
 
-            call_kwargs = mock_basic_config.call_args[1]
-            assert call_kwargs.get("force") is True
+        call_kwargs = mock_basic.call_args[1]
+        assert call_kwargs.get("force") is True
 
-    def test_accepts_both_level_and_verbose(self):
+    def test_accepts_both_level_and_verbose(self, mock_basic):
         """Should accept both level and verbose parameters."""
-        with patch("logging.basicConfig") as mock_basic_config:
-            configure_logging(level=logging.DEBUG, verbose=True)
-
-            call_kwargs = mock_basic_config.call_args[1]
-            assert call_kwargs["level"] == logging.DEBUG
+        configure_logging(level=logging.DEBUG, verbose=True)
 
-    def test_verbose_flag_affects_handler(self):
-        """Should configure handler differently based on verbose flag."""
-        # Just test that it accepts verbose parameter without error
-        with patch("logging.basicConfig"):
-            configure_logging(verbose=True)
-            configure_logging(verbose=False)
+        call_kwargs = mock_basic.call_args[1]
+        assert call_kwargs["level"] == logging.DEBUG
 
 
 class TestGetLogger:
@@ -83,18 +77,15 @@ class TestGetLogger:
         logger = get_logger("test_logger")
         assert isinstance(logger, logging.Logger)
 
-    def test_creates_logger_with_correct_name(self):
-        """Should create logger with specified name."""
-        logger = get_logger("my_module")
-        assert logger.name == "my_module"
-
     @pytest.mark.parametrize(
         "logger_name",
         [
+            "my_module",
             "module1",
             "module.submodule",
             "slidr.build",
             "slidr.cli",
+            "slidr.test_module",
             "__main__",
         ],
     )
@@ -138,20 +129,14 @@ class TestGetLogger:
         assert logger1.level == logging.DEBUG
         assert logger2.level == logging.ERROR
 
-    def test_accepts_module_name_pattern(self):
-        """Should work with __name__ pattern for module names."""
-        module_name = "slidr.test_module"
-        logger = get_logger(module_name)
-        assert logger.name == module_name
-
 
 class TestModuleInitialization:
-    """Tests for module-level initialization."""
+    """Tests for module-level behavior."""
 
-    def test_module_configures_logging_on_import(self):
-        """Should configure logging when module is imported."""
-        # This is implicitly tested by importing the module
-        # The configure_logging() call at module level should work
+    def test_module_exposes_logging_helpers(self):
+        """Should expose the logging helpers without side effects on import."""
+        # Importing must not configure logging; the CLI entry point calls
+        # configure_logging() explicitly before dispatching commands.
         from slidr import logging_utils
 
         assert hasattr(logging_utils, "configure_logging")
@@ -161,6 +146,13 @@ class TestModuleInitialization:
 class TestLoggerUsage:
     """Integration tests for logger usage."""
 
+    @pytest.fixture(autouse=True)
+    def _mute_logging(self):
+        """Short-circuit handler dispatch for the smoke-log calls below."""
+        logging.disable(logging.CRITICAL)
+        yield
+        logging.disable(logging.NOTSET)
+
     def test_logger_can_log_messages(self):
         """Should be able to log messages at different levels."""
         logger = get_logger("test_integration")
@@ -1,6 +1,9 @@
 """Tests for new.py module."""
 
 import argparse
+import importlib.resources
+import os
+import stat
 from pathlib import Path
 
 import pytest
@@ -9,6 +12,33 @@ from slidr.new import init_project
 from slidr.utils import get_default_theme_path
 
 
+def make_args(project: Path, markdown: str = "deck.md") -> argparse.Namespace:
+    """Build the argument namespace init_project expects."""
+    return argparse.Namespace(project=str(project), markdown=markdown)
+
+
+def assert_dir(path: Path) -> None:
+    """Assert path is an existing directory with a single stat call."""
+    assert stat.S_ISDIR(os.stat(path).st_mode)
+
+
+def assert_file(path: Path) -> None:
+    """Assert path is an existing regular file with a single stat call."""
+    assert stat.S_ISREG(os.stat(path).st_mode)
+
+
+@pytest.fixture(scope="session")
+def prebuilt_project(tmp_path_factory) -> Path:
+    """Project scaffolded once for the read-only assertion tests.
+
+    init_project is pure filesystem output, so tests that only inspect
+    the result share a single build instead of re-running the scaffold.
+    """
+    project_dir = tmp_path_factory.mktemp("proto") / "test_project"
+    assert init_project(make_args(project_dir)) == 0
+    return project_dir
+
+
 class TestGetDefaultThemePath:
     """Tests for get_default_theme_path function in utils module."""
 
@@ -24,46 +54,25 @@ class TestGetDefaultThemePath:
         assert result.parent.name == "assets"
 
     def test_default_theme_exists(self):
-        """Should return a path that exists."""
-        result = get_default_theme_path()
-        assert result.exists()
+        """Should point at a packaged resource that exists."""
+        resource = importlib.resources.files("slidr") / "assets" / "default.css"
+        assert resource.is_file()
 
 
 class TestInitProject:
     """Tests for init_project function."""
 
-    def test_creates_project_directory(self, tmp_path: Path):
+    def test_creates_project_directory(self, prebuilt_project: Path):
         """Should create project directory."""
-        project_dir = tmp_path / "test_project"
-        args = argparse.Namespace(project=str(project_dir), markdown="deck.md")
-
-        result = init_project(args)
+        assert_dir(prebuilt_project)
 
-        assert result == 0
-        assert project_dir.exists()
-        assert project_dir.is_dir()
-
-    def test_creates_deck_subdirectory(self, tmp_path: Path):
+    def test_creates_deck_subdirectory(self, prebuilt_project: Path):
         """Should create deck subdirectory inside project."""
-        project_dir = tmp_path / "test_project"
-        args = argparse.Namespace(project=str(project_dir), markdown="deck.md")
+        assert_dir(prebuilt_project / "deck")
 
-        init_project(args)
-
-        deck_dir = project_dir / "deck"
-        assert deck_dir.exists()
-        assert deck_dir.is_dir()
-
-    def test_creates_markdown_file_with_default_name(self, tmp_path: Path):
+    def test_creates_markdown_file_with_default_name(self, prebuilt_project: Path):
         """Should create markdown file with default name."""
-        project_dir = tmp_path / "test_project"
-        args = argparse.Namespace(project=str(project_dir), markdown="deck.md")
-
-        init_project(args)
-
-        md_file = project_dir / "deck" / "deck.md"
-        assert md_file.exists()
-        assert md_file.is_file()
+        assert_file(prebuilt_project / "deck" / "deck.md")
 
     @pytest.mark.parametrize(
         "markdown_name",
@@ -78,95 +87,53 @@ class TestInitProject:
     ):
         """Should create markdown file with custom name."""
         project_dir = tmp_path / "test_project"
-        args = argparse.Namespace(project=str(project_dir), markdown=markdown_name)
-
-        init_project(args)
+        init_project(make_args(project_dir, markdown=markdown_name))
 
         md_file = project_dir / "deck" / markdown_name
         assert md_file.exists()
 
-    def test_markdown_file_has_default_content(self, tmp_path: Path):
-        """Should populate markdown file with default slide content."""
-        project_dir = tmp_path / "test_project"
-        args = argparse.Namespace(project=str(project_dir), markdown="deck.md")
-
-        init_project(args)
-
-        md_file = project_dir / "deck" / "deck.md"
+    def test_markdown_file_content(self, prebuilt_project: Path):
+        """Should populate the markdown file with three default slides."""
+        md_file = prebuilt_project / "deck" / "deck.md"
         content = md_file.read_text()
 
         assert "# Slide 1" in content
         assert "# Slide 2" in content
         assert "# Slide 3" in content
-        assert "---" in content
-
-    def test_markdown_content_has_three_slides(self, tmp_path: Path):
-        """Should create markdown with three default slides."""
-        project_dir = tmp_path / "test_project"
-        args = argparse.Namespace(project=str(project_dir), markdown="deck.md")
 
-        init_project(args)
+        # 2 separators = 3 slides
+        assert content.count("---") == 2
 
-        md_file = project_dir / "deck" / "deck.md"
-        content = md_file.read_text()
-
-        # Count slide separators
-        separator_count = content.count("---")
-        assert separator_count == 2  # 2 separators = 3 slides
-
-    def test_copies_default_theme_to_deck(self, tmp_path: Path):
+    def test_copies_default_theme_to_deck(self, prebuilt_project: Path):
         """Should copy default theme.css to deck directory."""
-        project_dir = tmp_path / "test_project"
-        args = argparse.Namespace(project=str(project_dir), markdown="deck.md")
+        assert_file(prebuilt_project / "deck" / "theme.css")
 
-        init_project(args)
-
-        theme_file = project_dir / "deck" / "theme.css"
-        assert theme_file.exists()
-        assert theme_file.is_file()
-
-    def test_theme_file_has_css_content(self, tmp_path: Path):
+    def test_theme_file_has_css_content(self, prebuilt_project: Path):
         """Should copy CSS content to theme file."""
-        project_dir = tmp_path / "test_project"
-        args = argparse.Namespace(project=str(project_dir), markdown="deck.md")
-
-        init_project(args)
-
-        theme_file = project_dir / "deck" / "theme.css"
+        theme_file = prebuilt_project / "deck" / "theme.css"
         content = theme_file.read_text()
 
         # Should contain CSS
         assert len(content) > 0
         assert content.strip()  # Not just whitespace
 
-    def test_handles_existing_project_directory(self, tmp_path: Path):
-        """Should not fail if project directory already exists."""
-        project_dir = tmp_path / "test_project"
-        project_dir.mkdir()
-
-        args = argparse.Namespace(project=str(project_dir), markdown="deck.md")
-
-        result = init_project(args)
-        assert result == 0
-
-    def test_handles_existing_deck_directory(self, tmp_path: Path):
-        """Should not fail if deck directory already exists."""
-        project_dir = tmp_path / "test_project"
-        project_dir.mkdir()
-        deck_dir = project_dir / "deck"
-        deck_dir.mkdir()
-
-        args = argparse.Namespace(project=str(project_dir), markdown="deck.md")
-
-        result = init_project(args)
-        assert result == 0
-
-    def test_creates_nested_project_directories(self, tmp_path: Path):
-        """Should create nested directories in project path."""
-        project_dir = tmp_path / "parent" / "child" / "test_project"
-        args = argparse.Namespace(project=str(project_dir), markdown="deck.md")
+    @pytest.mark.parametrize(
+        "project_rel,premade",
+        [
+            pytest.param("test_project", ["."], id="existing-project"),
+            pytest.param("test_project", [".", "deck"], id="existing-deck"),
+            pytest.param("parent/child/test_project", [], id="nested"),
+        ],
+    )
+    def test_handles_existing_and_nested_directories(
+        self, tmp_path: Path, project_rel: str, premade: list[str]
+    ):
+        """Should succeed whether target directories pre-exist or are nested."""
+        project_dir = tmp_path / project_rel
+        for rel in premade:
+            (project_dir / rel).mkdir(parents=True, exist_ok=True)
 
-        result = init_project(args)
+        result = init_project(make_args(project_dir))
 
         assert result == 0
         assert project_dir.exists()
@@ -175,9 +142,7 @@ class TestInitProject:
     def test_returns_zero_exit_code(self, tmp_path: Path):
         """Should return 0 exit code on success."""
         project_dir = tmp_path / "test_project"
-        args = argparse.Namespace(project=str(project_dir), markdown="deck.md")
-
-        result = init_project(args)
+        result = init_project(make_args(project_dir))
         assert result == 0
 
     @pytest.mark.parametrize(
@@ -193,32 +158,22 @@ class TestInitProject:
     def test_handles_various_project_names(self, tmp_path: Path, project_name: str):
         """Should handle various valid project name formats."""
         project_dir = tmp_path / project_name
-        args = argparse.Namespace(project=str(project_dir), markdown="deck.md")
-
-        result = init_project(args)
+        result = init_project(make_args(project_dir))
 
         assert result == 0
         assert project_dir.exists()
 
-    def test_all_required_files_created(self, tmp_path: Path):
+    def test_all_required_files_created(self, prebuilt_project: Path):
         """Should create all required files and directories."""
-        project_dir = tmp_path / "test_project"
-        args = argparse.Namespace(project=str(project_dir), markdown="deck.md")
-
-        init_project(args)
-
         # Check all expected paths
-        assert project_dir.exists()
-        assert (project_dir / "deck").exists()
-        assert (project_dir / "deck" / "deck.md").exists()
-        assert (project_dir / "deck" / "theme.css").exists()
+        assert_dir(prebuilt_project)
+        assert_dir(prebuilt_project / "deck")
+        assert_file(prebuilt_project / "deck" / "deck.md")
+        assert_file(prebuilt_project / "deck" / "theme.css")
 
-    def test_markdown_and_theme_files_are_files_not_directories(self, tmp_path: Path):
+    def test_markdown_and_theme_files_are_files_not_directories(
+        self, prebuilt_project: Path
+    ):
         """Should create files, not directories."""
-        project_dir = tmp_path / "test_project"
-        args = argparse.Namespace(project=str(project_dir), markdown="deck.md")
-
-        init_project(args)
-
-        assert (project_dir / "deck" / "deck.md").is_file()
-        assert (project_dir / "deck" / "theme.css").is_file()
+        assert_file(prebuilt_project / "deck" / "deck.md")
+        assert_file(prebuilt_project / "deck" / "theme.css")
@@ -1,38 +1,54 @@
 """Tests for serve.py module."""
 
 import argparse
-import contextlib
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from threading import Thread
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch
 
 import pytest
+import watchfiles
 
-from slidr.serve import create_build_args, serve_deck
+from slidr import serve as serve_module
+from slidr.serve import DeckServer, _get_watch_filter, create_build_args, serve_deck
 
 
-class TestCreateBuildArgs:
-    """Tests for create_build_args function."""
+class TestWatchFilter:
+    """Tests for the deck watch filter."""
 
-    def test_returns_namespace_object(self, temp_deck_dir: Path):
-        """Should return argparse.Namespace object."""
-        result = create_build_args(temp_deck_dir, None)
-        assert isinstance(result, argparse.Namespace)
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("/deck/deck.md", True),
+            ("/deck/theme.css", True),
+            ("/deck/index.html", False),
+            ("/deck/notes.txt", False),
+            ("/deck/.git/deck.md", False),
+        ],
+    )
+    def test_filters_rebuild_relevant_events(self, path: str, expected: bool):
+        """Should pass deck sources and reject the build output.
+
+        Rejecting index.html is what prevents each rebuild from
+        triggering the next one.
+        """
+        deck_filter = _get_watch_filter()
+        assert deck_filter(watchfiles.Change.modified, path) is expected
 
-    def test_includes_deck_path(self, temp_deck_dir: Path):
-        """Should include deck path in namespace."""
-        result = create_build_args(temp_deck_dir, None)
-        assert result.deck == str(temp_deck_dir)
 
-    def test_includes_output_path(self, temp_deck_dir: Path):
-        """Should include output path pointing to index.html."""
-        result = create_build_args(temp_deck_dir, None)
-        expected_output = str(temp_deck_dir / "index.html")
-        assert result.output == expected_output
+class TestCreateBuildArgs:
+    """Tests for create_build_args function."""
 
-    def test_includes_theme_when_none(self, temp_deck_dir: Path):
-        """Should include theme as None when not provided."""
-        result = create_build_args(temp_deck_dir, None)
+    def test_none_theme_namespace(self, temp_deck_dir_ro: Path):
+        """Should build a complete string-valued namespace for a None theme."""
+        result = create_build_args(temp_deck_dir_ro, None)
+
+        assert isinstance(result, argparse.Namespace)
+        assert result.deck == str(temp_deck_dir_ro)
+        assert result.output == str(temp_deck_dir_ro / "index.html")
         assert result.theme is None
+        assert isinstance(result.deck, str)
+        assert isinstance(result.output, str)
 
     @pytest.mark.parametrize(
         "theme_path",
@@ -42,371 +58,247 @@ class TestCreateBuildArgs:
             "/absolute/path/theme.css",
         ],
     )
-    def test_includes_theme_when_provided(self, temp_deck_dir: Path, theme_path: str):
+    def test_includes_theme_when_provided(
+        self, temp_deck_dir_ro: Path, theme_path: str
+    ):
         """Should include theme path when provided."""
-        result = create_build_args(temp_deck_dir, theme_path)
+        result = create_build_args(temp_deck_dir_ro, theme_path)
         assert result.theme == theme_path
 
-    def test_converts_path_to_string(self, temp_deck_dir: Path):
-        """Should convert Path objects to strings."""
-        result = create_build_args(temp_deck_dir, None)
-        assert isinstance(result.deck, str)
-        assert isinstance(result.output, str)
-
 
 class TestServeDeck:
     """Tests for serve_deck function."""
 
-    def test_raises_error_for_nonexistent_deck(self, tmp_path: Path):
+    @pytest.fixture(autouse=True)
+    def serve_mocks(self):
+        """Patch serve_deck's collaborators and yield the mocks by name.
+
+        Autouse so no test in this class can accidentally hit the real
+        build, server or watcher; tests that inspect the mocks still
+        request the fixture by name.
+
+        watchfiles.watch is patched on its own module because serve.py
+        imports it lazily inside serve_deck.
+        """
+        with (
+            patch.multiple(
+                serve_module,
+                build_deck=DEFAULT,
+                DeckServer=DEFAULT,
+                Thread=DEFAULT,
+            ) as mocks,
+            patch.object(watchfiles, "watch") as mock_watch,
+        ):
+            # spec'd mocks restrict attribute access to the real API and
+            # skip MagicMock's per-access child mock creation
+            mocks["DeckServer"].return_value = Mock(spec=DeckServer)
+            mocks["Thread"].return_value = Mock(spec=Thread)
+            mock_watch.return_value = ()
+            yield SimpleNamespace(watch=mock_watch, **mocks)
+
+    @pytest.fixture
+    def make_args(self, temp_deck_dir_ro: Path):
+        """Factory for the serve argument namespace with default values."""
+
+        def _make(**overrides) -> argparse.Namespace:
+            values = {"deck": str(temp_deck_dir_ro), "port": 8000, "theme": None}
+            values.update(overrides)
+            return argparse.Namespace(**values)
+
+        return _make
+
+    def test_raises_error_for_nonexistent_deck(
+        self, make_args, monkeypatch: pytest.MonkeyPatch
+    ):
         """Should raise FileNotFoundError for nonexistent deck directory."""
-        args = argparse.Namespace(
-            deck=str(tmp_path / "nonexistent"), port=8000, theme=None
-        )
+        # Pure error-path test: report every path as missing instead of
+        # stat'ing a real directory
+        monkeypatch.setattr(Path, "exists", lambda self, **kwargs: False)
+        args = make_args(deck="nonexistent")
 
         with pytest.raises(FileNotFoundError, match="Deck directory not found"):
             serve_deck(args)
 
-    @patch("slidr.serve.build_deck")
-    @patch("slidr.serve.HTTPServer")
-    @patch("slidr.serve.Thread")
-    @patch("slidr.serve.watch")
-    def test_performs_initial_build(
-        self,
-        mock_watch: Mock,
-        mock_thread: Mock,
-        mock_server_class: Mock,
-        mock_build: Mock,
-        temp_deck_dir: Path,
-    ):
+    def test_performs_initial_build(self, serve_mocks, make_args):
         """Should perform initial build before starting server."""
-        # Setup mocks
-        mock_server = MagicMock()
-        mock_server_class.return_value = mock_server
-        mock_watch.return_value = iter([])  # Empty iterator
+        args = make_args()
 
-        args = argparse.Namespace(deck=str(temp_deck_dir), port=8000, theme=None)
-
-        with contextlib.suppress(StopIteration):
-            serve_deck(args)
+        serve_deck(args)
 
         # Verify initial build was called
-        assert mock_build.call_count >= 1
+        assert serve_mocks.build_deck.call_count >= 1
 
-    @patch("slidr.serve.build_deck")
-    @patch("slidr.serve.HTTPServer")
-    @patch("slidr.serve.Thread")
-    @patch("slidr.serve.watch")
-    def test_starts_http_server_on_correct_port(
-        self,
-        mock_watch: Mock,
-        mock_thread: Mock,
-        mock_server_class: Mock,
-        mock_build: Mock,
-        temp_deck_dir: Path,
-    ):
+    def test_starts_http_server_on_correct_port(self, serve_mocks, make_args):
         """Should start HTTP server on specified port."""
-        mock_server = MagicMock()
-        mock_server_class.return_value = mock_server
-        mock_watch.return_value = iter([])
-
-        args = argparse.Namespace(deck=str(temp_deck_dir), port=8080, theme=None)
+        args = make_args(port=8080)
 
-        with contextlib.suppress(StopIteration):
-            serve_deck(args)
+        serve_deck(args)
 
         # Verify server was created with correct port
-        mock_server_class.assert_called_once()
-        call_args = mock_server_class.call_args[0]
+        serve_mocks.DeckServer.assert_called_once()
+        call_args = serve_mocks.DeckServer.call_args[0]
         assert call_args[0] == ("localhost", 8080)
 
-    @patch("slidr.serve.build_deck")
-    @patch("slidr.serve.HTTPServer")
-    @patch("slidr.serve.Thread")
-    @patch("slidr.serve.watch")
-    def test_starts_server_thread(
-        self,
-        mock_watch: Mock,
-        mock_thread_class: Mock,
-        mock_server_class: Mock,
-        mock_build: Mock,
-        temp_deck_dir: Path,
-    ):
+    def test_starts_server_thread(self, serve_mocks, make_args):
         """Should start server in background thread."""
-        mock_server = MagicMock()
-        mock_server_class.return_value = mock_server
-        mock_thread = MagicMock()
-        mock_thread_class.return_value = mock_thread
-        mock_watch.return_value = iter([])
+        args = make_args()
 
-        args = argparse.Namespace(deck=str(temp_deck_dir), port=8000, theme=None)
-
-        with contextlib.suppress(StopIteration):
-            serve_deck(args)
+        serve_deck(args)
 
         # Verify thread was created and started
-        mock_thread_class.assert_called_once()
-        mock_thread.start.assert_called_once()
+        serve_mocks.Thread.assert_called_once()
+        serve_mocks.Thread.return_value.start.assert_called_once()
 
-    @patch("slidr.serve.build_deck")
-    @patch("slidr.serve.HTTPServer")
-    @patch("slidr.serve.Thread")
-    @patch("slidr.serve.watch")
     def test_watches_deck_directory_for_changes(
-        self,
-        mock_watch: Mock,
-        mock_thread: Mock,
-        mock_server_class: Mock,
-        mock_build: Mock,
-        temp_deck_dir: Path,
+        self, serve_mocks, make_args, temp_deck_dir_ro_resolved: Path
     ):
         """Should watch deck directory for file changes."""
-        mock_server = MagicMock()
-        mock_server_class.return_value = mock_server
-        mock_watch.return_value = iter([])
+        args = make_args()
 
-        args = argparse.Namespace(deck=str(temp_deck_dir), port=8000, theme=None)
-
-        with contextlib.suppress(StopIteration):
-            serve_deck(args)
+        serve_deck(args)
 
         # Verify watch was called with deck directory
-        mock_watch.assert_called_once()
-        watch_path = mock_watch.call_args[0][0]
-        assert watch_path == str(temp_deck_dir.resolve())
-
-    @patch("slidr.serve.build_deck")
-    @patch("slidr.serve.HTTPServer")
-    @patch("slidr.serve.Thread")
-    @patch("slidr.serve.watch")
-    @patch("slidr.serve.time.time")
-    def test_rebuilds_on_file_changes(
-        self,
-        mock_time: Mock,
-        mock_watch: Mock,
-        mock_thread: Mock,
-        mock_server_class: Mock,
-        mock_build: Mock,
-        temp_deck_dir: Path,
-    ):
-        """Should rebuild when file changes are detected."""
-        mock_server = MagicMock()
-        mock_server_class.return_value = mock_server
-
-        # Mock time to control debouncing
-        mock_time.side_effect = [
-            0,
-            2,
-            4,
-        ]  # Initial, after first change, after second change
-
-        # Simulate file changes
-        changes = [
-            {("change", str(temp_deck_dir / "deck.md"))},
-            {("change", str(temp_deck_dir / "theme.css"))},
-        ]
-        mock_watch.return_value = iter(changes)
-
-        args = argparse.Namespace(deck=str(temp_deck_dir), port=8000, theme=None)
-
-        with contextlib.suppress(StopIteration):
-            serve_deck(args)
+        serve_mocks.watch.assert_called_once()
+        watch_path = serve_mocks.watch.call_args[0][0]
+        assert watch_path == str(temp_deck_dir_ro_resolved)
 
-        # Should have: initial build + rebuilds for changes
-        assert mock_build.call_count >= 2
-
-    @patch("slidr.serve.build_deck")
-    @patch("slidr.serve.HTTPServer")
-    @patch("slidr.serve.Thread")
-    @patch("slidr.serve.watch")
-    @patch("slidr.serve.time.time")
-    def test_debounces_rapid_changes(
+    @pytest.mark.parametrize(
+        "times,edits,build_effects,min_builds",
+        [
+            pytest.param(
+                [0, 2, 4],
+                ["# Updated slide", "# Updated slide again"],
+                None,
+                2,
+                id="rebuilds-on-changes",
+            ),
+            pytest.param(
+                # First two changes land within the 1 second debounce window
+                [0, 0.5, 0.6, 2],
+                ["# Edit 1", "# Edit 2", "# Edit 3"],
+                None,
+                2,
+                id="debounces-rapid-changes",
+            ),
+            pytest.param(
+                # Second build fails; serving must continue regardless
+                [0, 2, 4],
+                ["# Edit 1", "# Edit 2"],
+                [None, Exception("Build error"), None],
+                3,
+                id="continues-after-build-error",
+            ),
+        ],
+    )
+    def test_rebuild_loop(
         self,
-        mock_time: Mock,
-        mock_watch: Mock,
-        mock_thread: Mock,
-        mock_server_class: Mock,
-        mock_build: Mock,
+        serve_mocks,
+        make_args,
         temp_deck_dir: Path,
+        times: list[float],
+        edits: list[str],
+        build_effects: list | None,
+        min_builds: int,
     ):
-        """Should debounce rapid file changes (1 second threshold)."""
-        mock_server = MagicMock()
-        mock_server_class.return_value = mock_server
+        """Should rebuild on debounced changes and survive build errors."""
+        if build_effects is not None:
+            serve_mocks.build_deck.side_effect = build_effects
 
-        # Mock time: second change happens within 1 second
-        mock_time.side_effect = [0, 0.5, 0.6, 2]
+        md_file = temp_deck_dir / "deck.md"
+        event = frozenset({("change", str(md_file))})
 
-        # Simulate rapid changes
-        changes = [
-            {("change", str(temp_deck_dir / "deck.md"))},
-            {("change", str(temp_deck_dir / "deck.md"))},  # Within debounce window
-            {("change", str(temp_deck_dir / "deck.md"))},  # After debounce window
-        ]
-        mock_watch.return_value = iter(changes)
+        def changes():
+            # Rewrite the markdown before each event so the content
+            # fingerprint changes and the rebuild is not skipped
+            for edit in edits:
+                md_file.write_text(edit)
+                yield event
 
-        args = argparse.Namespace(deck=str(temp_deck_dir), port=8000, theme=None)
+        serve_mocks.watch.return_value = changes()
 
-        with contextlib.suppress(StopIteration):
-            serve_deck(args)
+        args = make_args(deck=str(temp_deck_dir))
 
-        # Should have: initial + rebuilds (some may be debounced)
-        # At least 2 builds (initial + one allowed rebuild)
-        assert mock_build.call_count >= 2
+        serve_deck(args, clock=iter(times).__next__)
 
-    @patch("slidr.serve.build_deck")
-    @patch("slidr.serve.HTTPServer")
-    @patch("slidr.serve.Thread")
-    @patch("slidr.serve.watch")
-    def test_handles_keyboard_interrupt(
-        self,
-        mock_watch: Mock,
-        mock_thread: Mock,
-        mock_server_class: Mock,
-        mock_build: Mock,
-        temp_deck_dir: Path,
-    ):
-        """Should handle KeyboardInterrupt and shutdown gracefully."""
-        mock_server = MagicMock()
-        mock_server_class.return_value = mock_server
+        # Initial build plus the rebuilds the debounce window allows
+        assert serve_mocks.build_deck.call_count >= min_builds
 
+    def test_handles_keyboard_interrupt(self, serve_mocks, make_args):
+        """Should handle KeyboardInterrupt and shutdown gracefully."""
         # Simulate KeyboardInterrupt
-        mock_watch.return_value = iter([])
-        mock_watch.side_effect = KeyboardInterrupt()
+        serve_mocks.watch.side_effect = KeyboardInterrupt()
 
-        args = argparse.Namespace(deck=str(temp_deck_dir), port=8000, theme=None)
+        args = make_args()
 
         result = serve_deck(args)
 
         # Should return 0 and shutdown server
         assert result == 0
-        mock_server.shutdown.assert_called_once()
+        serve_mocks.DeckServer.return_value.shutdown.assert_called_once()
 
-    @patch("slidr.serve.build_deck")
-    @patch("slidr.serve.HTTPServer")
-    @patch("slidr.serve.Thread")
-    @patch("slidr.serve.watch")
     def test_uses_custom_theme_in_builds(
-        self,
-        mock_watch: Mock,
-        mock_thread: Mock,
-        mock_server_class: Mock,
-        mock_build: Mock,
-        temp_deck_dir: Path,
-        tmp_path: Path,
+        self, serve_mocks, make_args, temp_deck_dir: Path, tmp_path: Path
     ):
         """Should pass custom theme to build commands."""
-        mock_server = MagicMock()
-        mock_server_class.return_value = mock_server
-
-        # Mock time for debouncing
-        with patch("slidr.serve.time.time", side_effect=[0, 2]):
-            changes = [{("change", str(temp_deck_dir / "deck.md"))}]
-            mock_watch.return_value = iter(changes)
-
-            custom_theme = tmp_path / "custom.css"
-            custom_theme.write_text("body { color: blue; }")
-
-            args = argparse.Namespace(
-                deck=str(temp_deck_dir), port=8000, theme=str(custom_theme)
-            )
-
-            with contextlib.suppress(StopIteration):
-                serve_deck(args)
-
-            # Check that builds received theme argument
-            for call in mock_build.call_args_list:
-                build_args = call[0][0]
-                assert build_args.theme == str(custom_theme)
-
-    @patch("slidr.serve.build_deck")
-    @patch("slidr.serve.HTTPServer")
-    @patch("slidr.serve.Thread")
-    @patch("slidr.serve.watch")
-    @patch("slidr.serve.time.time")
-    def test_continues_serving_after_build_error(
-        self,
-        mock_time: Mock,
-        mock_watch: Mock,
-        mock_thread: Mock,
-        mock_server_class: Mock,
-        mock_build: Mock,
-        temp_deck_dir: Path,
-    ):
-        """Should continue serving even if a rebuild fails."""
-        mock_server = MagicMock()
-        mock_server_class.return_value = mock_server
+        md_file = temp_deck_dir / "deck.md"
+        event = frozenset({("change", str(md_file))})
 
-        # Mock time
-        mock_time.side_effect = [0, 2, 4]
+        def changes():
+            # Edit the deck before the event so the rebuild isn't
+            # skipped by the unchanged-fingerprint check
+            md_file.write_text("# Themed edit")
+            yield event
 
-        # First build succeeds, second fails, third succeeds
-        mock_build.side_effect = [None, Exception("Build error"), None]
+        serve_mocks.watch.return_value = changes()
 
-        changes = [
-            {("change", str(temp_deck_dir / "deck.md"))},
-            {("change", str(temp_deck_dir / "deck.md"))},
-        ]
-        mock_watch.return_value = iter(changes)
+        custom_theme = tmp_path / "custom.css"
+        custom_theme.write_text("body { color: blue; }")
 
-        args = argparse.Namespace(deck=str(temp_deck_dir), port=8000, theme=None)
+        args = make_args(deck=str(temp_deck_dir), theme=str(custom_theme))
 
-        with contextlib.suppress(StopIteration):
-            serve_deck(args)
+        serve_deck(args, clock=iter([0, 2]).__next__)
+
+        # Initial build and the rebuild both receive the theme argument
+        assert serve_mocks.build_deck.call_count == 2
+        for call in serve_mocks.build_deck.call_args_list:
+            build_args = call[0][0]
+            assert build_args.theme == str(custom_theme)
+
+    def test_skips_rebuild_when_inputs_unchanged(
+        self, serve_mocks, make_args, temp_deck_dir_ro: Path
+    ):
+        """Should skip the rebuild when the build inputs did not change."""
+        # A change event without an actual edit, e.g. a spurious event
+        # from an editor writing metadata
+        event = frozenset({("change", str(temp_deck_dir_ro / "deck.md"))})
+        serve_mocks.watch.return_value = (event,)
+
+        args = make_args()
+
+        serve_deck(args, clock=iter([0, 2]).__next__)
 
-        # Should have attempted all builds
-        assert mock_build.call_count == 3
+        # Only the initial build; the unchanged fingerprint skips the rest
+        assert serve_mocks.build_deck.call_count == 1
 
-    @patch("slidr.serve.build_deck")
-    @patch("slidr.serve.HTTPServer")
-    @patch("slidr.serve.Thread")
-    @patch("slidr.serve.watch")
     @patch("os.chdir")
     def test_changes_to_deck_directory(
-        self,
-        mock_chdir: Mock,
-        mock_watch: Mock,
-        mock_thread: Mock,
-        mock_server_class: Mock,
-        mock_build: Mock,
-        temp_deck_dir: Path,
+        self, mock_chdir: Mock, serve_mocks, make_args, temp_deck_dir_ro_resolved: Path
     ):
         """Should change to deck directory before serving."""
-        mock_server = MagicMock()
-        mock_server_class.return_value = mock_server
-        mock_watch.return_value = iter([])
+        args = make_args()
 
-        args = argparse.Namespace(deck=str(temp_deck_dir), port=8000, theme=None)
-
-        with contextlib.suppress(StopIteration):
-            serve_deck(args)
+        serve_deck(args)
 
         # Verify chdir was called with deck directory
-        mock_chdir.assert_called_once_with(temp_deck_dir.resolve())
+        mock_chdir.assert_called_once_with(temp_deck_dir_ro_resolved)
 
-    @patch("slidr.serve.build_deck")
-    @patch("slidr.serve.HTTPServer")
-    @patch("slidr.serve.Thread")
-    @patch("slidr.serve.watch")
-    def test_server_thread_is_daemon(
-        self,
-        mock_watch: Mock,
-        mock_thread_class: Mock,
-        mock_server_class: Mock,
-        mock_build: Mock,
-        temp_deck_dir: Path,
-    ):
+    def test_server_thread_is_daemon(self, serve_mocks, make_args):
         """Should create server thread as daemon."""
-        mock_server = MagicMock()
-        mock_server_class.return_value = mock_server
-        mock_thread = MagicMock()
-        mock_thread_class.return_value = mock_thread
-        mock_watch.return_value = iter([])
+        args = make_args()
 
-        args = argparse.Namespace(deck=str(temp_deck_dir), port=8000, theme=None)
-
-        with contextlib.suppress(StopIteration):
-            serve_deck(args)
+        serve_deck(args)
 
         # Verify thread was created with daemon=True
-        mock_thread_class.assert_called_once()
-        call_kwargs = mock_thread_class.call_args[1]
+        serve_mocks.Thread.assert_called_once()
+        call_kwargs = serve_mocks.Thread.call_args[1]
         assert call_kwargs.get("daemon") is True